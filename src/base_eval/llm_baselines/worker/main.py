@@ -5,6 +5,7 @@ import os
 import shutil
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Set up logging
 logger = logging.getLogger()
@@ -137,6 +138,60 @@ def parse_env_vars() -> tuple[str, constants.RunMode, str, str]:
     return forecast_due_date, run_mode, model_to_test, prompt_type
 
 
+def run_test_type(
+    model_to_test: str,
+    model_dict: dict,
+    test_type: str,
+    questions_to_eval: list,
+    forecast_due_date: str,
+    prompt_type: str,
+    market_use_freeze_value: bool,
+    base_file_path: str,
+) -> None:
+    """
+    Run inference for one test type, skipping it if its forecasts have already been saved.
+
+    Args:
+        model_to_test (str): Model key in constants.MODELS_TO_RUN.
+        model_dict (dict): Mapping of `model_to_test` to its model definition.
+        test_type (str): Test type as returned by model_eval.determine_test_type().
+        questions_to_eval (list): Questions to forecast.
+        forecast_due_date (str): Forecast due date of the question set.
+        prompt_type (str): Prompt variant used ("zero_shot" or "scratchpad").
+        market_use_freeze_value (bool): Whether market prompts include the freeze value.
+        base_file_path (str): GCS base path prefix for storing intermediate records.
+
+    Returns:
+        None
+    """
+    gcp_file_path = f"{base_file_path}/{test_type}/{model_to_test}.jsonl"
+
+    results = {
+        model_to_test: model_eval.download_and_read_saved_forecasts(
+            filename=gcp_file_path,
+            base_file_path=base_file_path,
+        )
+    }
+
+    if results[model_to_test]:
+        logger.info(f"Downloaded {gcp_file_path}. Skipping.")
+        return
+
+    logger.info(f"No results loaded for {gcp_file_path}. {model_to_test} is running inference...")
+    results[model_to_test] = {i: "" for i in range(len(questions_to_eval))}
+    model_eval.process_model(
+        model=model_to_test,
+        models=model_dict,
+        test_type=test_type,
+        results=results,
+        questions_to_eval=questions_to_eval,
+        forecast_due_date=forecast_due_date,
+        prompt_type=prompt_type,
+        market_use_freeze_value=market_use_freeze_value,
+        base_file_path=base_file_path,
+    )
+
+
 @decorator.log_runtime
 def main() -> None:
     """
@@ -156,11 +211,14 @@ def main() -> None:
 
     base_file_path = f"individual_forecast_records/{forecast_due_date}"
 
-    results = {}
     questions = get_questions(
         forecast_due_date=forecast_due_date,
         num_questions_per_question_type=num_questions_per_question_type,
     )
+
+    # Dataset questions map to the same test type with and without freeze values, so key the runs
+    # by test type to avoid running them twice.
+    runs = {}
     for question_set in questions:
         for market_use_freeze_value in [False, True]:
             test_type = model_eval.determine_test_type(
@@ -169,33 +227,25 @@ def main() -> None:
                 market_use_freeze_value,
                 run_mode,
             )
-            questions_to_eval = question_set
-
-            gcp_file_path = f"{base_file_path}/{test_type}/{model_to_test}.jsonl"
-
-            results[model_to_test] = model_eval.download_and_read_saved_forecasts(
-                filename=gcp_file_path,
+            runs.setdefault(test_type, (question_set, market_use_freeze_value))
+
+    with ThreadPoolExecutor(max_workers=len(runs)) as executor:
+        futures = [
+            executor.submit(
+                run_test_type,
+                model_to_test=model_to_test,
+                model_dict=model_dict,
+                test_type=test_type,
+                questions_to_eval=question_set,
+                forecast_due_date=forecast_due_date,
+                prompt_type=prompt_type,
+                market_use_freeze_value=market_use_freeze_value,
                 base_file_path=base_file_path,
             )
-
-            if results[model_to_test]:
-                logger.info(f"Downloaded {gcp_file_path}. Skipping.")
-            else:
-                logger.info(
-                    f"No results loaded for {gcp_file_path}. {model_to_test} is running inference..."
-                )
-                results[model_to_test] = {i: "" for i in range(len(questions_to_eval))}
-                model_eval.process_model(
-                    model=model_to_test,
-                    models=model_dict,
-                    test_type=test_type,
-                    results=results,
-                    questions_to_eval=questions_to_eval,
-                    forecast_due_date=forecast_due_date,
-                    prompt_type=prompt_type,
-                    market_use_freeze_value=market_use_freeze_value,
-                    base_file_path=base_file_path,
-                )
+            for test_type, (question_set, market_use_freeze_value) in runs.items()
+        ]
+        for future in futures:
+            future.result()
 
     model_eval.generate_final_forecast_files(
         forecast_due_date=forecast_due_date,
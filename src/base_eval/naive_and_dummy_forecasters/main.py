@@ -54,6 +54,17 @@ def get_day_before_forecast_due_date(forecast_due_date):
     return forecast_due_date - timedelta(days=1)
 
 
+def set_forecasts(df_standard, forecasts):
+    """Set the forecast for every (id, resolution_date) in df_standard in one merge.
+
+    `forecasts` is a list of (id, resolution_date, forecast) tuples.
+    """
+    df_forecasts = pd.DataFrame(forecasts, columns=["id", "resolution_date", "forecast"])
+    return df_standard.drop(columns="forecast").merge(
+        df_forecasts, on=["id", "resolution_date"], how="left"
+    )
+
+
 def get_prophet_forecast(
     source, df, dfr, day_before_forecast_due_date, prophet_args, forecast_due_date_plus_max_horizon
 ):
@@ -64,6 +75,7 @@ def get_prophet_forecast(
 
     resolution_dates = sorted(df_standard["resolution_date"].unique())
 
+    forecasts = []
     for mid in df_standard["id"].unique():
         dfr_mid = dfr[dfr["id"] == mid].sort_values(by="date", ignore_index=True).ffill().bfill()
         comparison_value = dfr_mid["value"].iloc[-1]
@@ -98,9 +110,9 @@ def get_prophet_forecast(
                     comparison_value, loc=forecast_mean, scale=forecast_std
                 )
 
-            mask = (df_standard["id"] == mid) & (df_standard["resolution_date"] == resolution_date)
-            df_standard.loc[mask, "forecast"] = get_bounded_forecast(prob_increase)
+            forecasts.append((mid, resolution_date, get_bounded_forecast(prob_increase)))
 
+    df_standard = set_forecasts(df_standard, forecasts)
     df = pd.concat(
         [
             df,
@@ -118,6 +130,7 @@ def get_wikipedia_forecast(df, dfr, forecast_due_date_plus_max_horizon):
 
     resolution_dates = sorted(df_standard["resolution_date"].unique())
 
+    forecasts = []
     for mid in df_standard["id"].unique():
         dfr_mid = dfr[dfr["id"] == mid].sort_values(by="date", ignore_index=True)
 
@@ -154,8 +167,7 @@ def get_wikipedia_forecast(df, dfr, forecast_due_date_plus_max_horizon):
             forecast_mean = row["yhat"].values[0]
             forecast_std = (row["yhat_upper"].values[0] - row["yhat_lower"].values[0]) / (2 * 1.28)
 
-            mask = (df_standard["id"] == mid) & (df_standard["resolution_date"] == resolution_date)
-            df_standard.loc[mask, "forecast"] = get_bounded_forecast(
+            forecast_value = get_bounded_forecast(
                 wikipedia.get_probability_forecast(
                     mid,
                     comparison_value,
@@ -163,7 +175,9 @@ def get_wikipedia_forecast(df, dfr, forecast_due_date_plus_max_horizon):
                     forecast_std,
                 )
             )
+            forecasts.append((mid, resolution_date, forecast_value))
 
+    df_standard = set_forecasts(df_standard, forecasts)
     df = pd.concat(
         [
             df,
@@ -181,6 +195,7 @@ def get_acled_forecast(df, dfr, day_before_forecast_due_date, forecast_due_date_
 
     resolution_dates = sorted(df_standard["resolution_date"].unique())
 
+    forecasts = []
     for mid in df_standard["id"].unique():
         d = acled.id_unhash(mid)
         country = d["country"]
@@ -219,8 +234,7 @@ def get_acled_forecast(df, dfr, day_before_forecast_due_date, forecast_due_date_
         forecast = model.predict(future)
 
         for resolution_date in resolution_dates:
-            mask = (df_standard["id"] == mid) & (df_standard["resolution_date"] == resolution_date)
-            df_standard.loc[mask, "forecast"] = get_bounded_forecast(
+            forecast_value = get_bounded_forecast(
                 acled.get_forecast(
                     comparison_value=comparison_value,
                     dfr=forecast.copy(),
@@ -229,7 +243,9 @@ def get_acled_forecast(df, dfr, day_before_forecast_due_date, forecast_due_date_
                     ref_date=resolution_date,
                 )
             )
+            forecasts.append((mid, resolution_date, forecast_value))
 
+    df_standard = set_forecasts(df_standard, forecasts)
     df = pd.concat([df, df_standard], ignore_index=True)
     return df
 
@@ -212,27 +212,19 @@ def get_forecast(comparison_value, dfr, country, col, ref_date):
     dfr = dfr[
         (dfr["event_date"].dt.date >= start_date) & (dfr["event_date"].dt.date < ref_date)
     ].reset_index(drop=True)
-    simulated_values = []
-    dates = [pd.to_datetime(ref_date) - timedelta(days=i) for i in range(len(dfr))]
-    for _ in range(1000):
-        draws = np.random.normal(dfr[col], (dfr["yhat_upper"] - dfr["yhat_lower"]) / (2 * 1.28))
-        df_draws = pd.DataFrame(
-            {
-                "country": country,
-                "event_date": dates,
-                col: draws,
-            }
-        )
-        simulated_values.append(
-            sum_over_past_30_days(
-                dfr=df_draws,
-                country=country,
-                col=col,
-                ref_date=ref_date,
-            )
-        )
+    # Simulate 1,000 paths at once. Each row is one path; columns follow the rows of `dfr`, which are
+    # dated backwards from `ref_date`. Sum each path over the same 30-day window that
+    # `sum_over_past_30_days` uses.
+    draw_dates = pd.to_datetime(ref_date) - pd.to_timedelta(np.arange(len(dfr)), unit="D")
+    in_window = (draw_dates.date >= start_date) & (draw_dates.date < ref_date)
+    draws = np.random.normal(
+        dfr[col].to_numpy(dtype=float),
+        ((dfr["yhat_upper"] - dfr["yhat_lower"]) / (2 * 1.28)).to_numpy(dtype=float),
+        size=(1000, len(dfr)),
+    )
+    simulated_values = np.nansum(draws[:, in_window], axis=1)
 
-    return float(np.mean([value > comparison_value for value in simulated_values]))
+    return float(np.mean(simulated_values > comparison_value))
 
 
 def get_base_comparison_value(key, dfr, country, col, ref_date):
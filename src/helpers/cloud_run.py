@@ -2,6 +2,7 @@
 
 import logging
 import sys
+from functools import cache
 
 from google.cloud import run_v2
 
@@ -13,6 +14,12 @@ logger = logging.getLogger(__name__)
 timeout_1h = 3600
 
 
+@cache
+def get_jobs_client():
+    """Return a Cloud Run Jobs client, created on first use and shared across calls."""
+    return run_v2.JobsClient()
+
+
 def call_worker(job_name, env_vars, task_count, timeout=timeout_1h):
     """Invoke a Cloud Run Job.
 
@@ -43,7 +50,7 @@ def run_job(job_name, env_vars=None, task_count=1, timeout=timeout_1h):
     task_count: override default task count.
     timeout: override default timeout.
     """
-    client = run_v2.JobsClient()
+    client = get_jobs_client()
     name = client.job_path(
         project=env.PROJECT_ID,
         location=env.CLOUD_DEPLOY_REGION,
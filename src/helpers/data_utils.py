@@ -174,6 +174,21 @@ def get_local_file_dir(bucket: str) -> str:
     return f"{local_dir}/{bucket}"
 
 
+def iter_records(df, chunksize=10_000):
+    """
+    Yield the rows of a DataFrame as dicts, converting `chunksize` rows at a time.
+
+    Equivalent to iterating over `df.to_dict(orient="records")` without materializing a dict for
+    every row up front.
+
+    Parameters:
+    - df (pandas.DataFrame): DataFrame to iterate over.
+    - chunksize (int): Number of rows to convert at a time.
+    """
+    for start in range(0, len(df), chunksize):
+        yield from df.iloc[start : start + chunksize].to_dict(orient="records")
+
+
 def upload_questions(dfq, source):
     """
     Write question data frame to disk and upload to cloud storage.
@@ -191,7 +206,7 @@ def upload_questions(dfq, source):
     dfq = dfq.sort_values(by=["id"], ignore_index=True)
 
     with open(local_question_filename, "w", encoding="utf-8") as f:
-        for record in dfq.to_dict(orient="records"):
+        for record in iter_records(dfq):
             jsonl_str = json.dumps(record, ensure_ascii=False)
             f.write(jsonl_str + "\n")
 
@@ -240,6 +255,50 @@ def upload_questions_and_resolution(dfq, dfr, source):
     upload_resolutions(dfq, source)
 
 
+def upsert_questions(dfq, questions, dtype=None):
+    """
+    Update existing questions and append new ones in a single pass.
+
+    Questions are matched on `id`. Fields missing from a question dict are kept from that
+    question's existing row in `dfq`. If a question appears more than once in `questions`, the
+    last entry wins.
+
+    Parameters:
+    - dfq (pandas.DataFrame): DataFrame containing the existing questions.
+    - questions (list): List of question dicts to update or add.
+    - dtype (dict, optional): Dtypes to apply to the newly-added questions.
+
+    Returns:
+    - pandas.DataFrame: dfq with the questions updated and added.
+    """
+    latest_questions = {q["id"]: q for q in questions}
+    if not latest_questions:
+        return dfq
+
+    is_updated = dfq["id"].isin(latest_questions.keys())
+    existing_questions = (
+        dfq[is_updated].drop_duplicates(subset="id").set_index("id", drop=False).to_dict("index")
+    )
+
+    updated_questions = []
+    new_questions = []
+    for question_id, question in latest_questions.items():
+        if question_id in existing_questions:
+            updated_questions.append({**existing_questions[question_id], **question})
+        else:
+            new_questions.append(question)
+
+    df_new = pd.DataFrame(new_questions)
+    if dtype is not None and not df_new.empty:
+        df_new = df_new.astype(dtype)
+
+    df_updated = pd.DataFrame(updated_questions)
+    return pd.concat(
+        [dfq[~is_updated]] + [df for df in (df_updated, df_new) if not df.empty],
+        ignore_index=True,
+    )
+
+
 def read_jsonl(file_path):
     """
     Read a JSONL file and return its content as a list of dictionaries.
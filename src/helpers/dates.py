@@ -3,6 +3,7 @@
 All datetimes should be stored as ISO 8601 in seconds in UTC.
 """
 
+import sys
 from datetime import datetime, timedelta, timezone
 
 import pytz
@@ -80,8 +81,11 @@ def convert_zulu_to_datetime(time_str: str) -> datetime:
     """Convert from Zulu time to datetime object.
 
     e.g. "2023-05-06T14:00:00Z" -> datetime.datetime(2023, 5, 6, 14, 0, tzinfo=datetime.timezone.utc)
+
+    `fromisoformat` only accepts a trailing "Z" as of Python 3.11.
     """
-    time_str = time_str.replace("Z", "+00:00")
+    if sys.version_info < (3, 11):
+        time_str = time_str.replace("Z", "+00:00")
     return datetime.fromisoformat(time_str)
 
 
@@ -1,10 +1,18 @@
 """utils for key-related tasks in llm-benchmark."""
 
+from functools import cache
+
 from google.cloud import secretmanager
 
 from . import env
 
 
+@cache
+def get_secret_manager_client():
+    """Return the Secret Manager client, creating it on first use."""
+    return secretmanager.SecretManagerServiceClient()
+
+
 def get_secret(secret_name, version_id="latest"):
     """
     Retrieve the payload of a specified secret version from Secret Manager.
@@ -13,7 +21,7 @@ def get_secret(secret_name, version_id="latest"):
     identified by `project_id`, `secret_name`, and `version_id`. Decodes the payload
     from bytes to a UTF-8 string and returns it.
     """
-    client = secretmanager.SecretManagerServiceClient()
+    client = get_secret_manager_client()
     name = f"projects/{env.PROJECT_ID}/secrets/{secret_name}/versions/{version_id}"
     response = client.access_secret_version(request={"name": name})
     return response.payload.data.decode("UTF-8")
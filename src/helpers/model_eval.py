@@ -6,8 +6,9 @@ import os
 import random
 import re
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from functools import partial
 
@@ -51,6 +52,35 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 TODAY_DATE = datetime.today().strftime("%Y-%m-%d")
 
+# Cap the number of in-flight requests per model source so that concurrent workers stay under the
+# provider rate limits instead of amplifying 429s through retries.
+MAX_CONCURRENT_REQUESTS_PER_SOURCE = 16
+SOURCE_SEMAPHORES = {
+    source: threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS_PER_SOURCE)
+    for source in [
+        constants.OAI_SOURCE,
+        constants.ANTHROPIC_SOURCE,
+        constants.TOGETHER_AI_SOURCE,
+        constants.GOOGLE_SOURCE,
+        constants.MISTRAL_SOURCE,
+        constants.XAI_SOURCE,
+    ]
+}
+
+# Patterns used to parse model responses, compiled once at import.
+PROBABILITY_PATTERN = re.compile(r"(?:\*\s*)?(\d*\.?\d+)%?(?:\s*\*)?")
+DECIMAL_PATTERN = re.compile(r"^\d*\.\d+$")
+INPUT_TOKENS_PATTERN = re.compile(r"Given: (\d+) `inputs` tokens")
+
+# Prompt templates by prompt type, keyed on (is_market_question, market_use_freeze_value).
+PROMPT_TEMPLATES = {
+    "zero_shot": {
+        (True, False): llm_prompts.ZERO_SHOT_MARKET_PROMPT,
+        (True, True): llm_prompts.ZERO_SHOT_MARKET_WITH_FREEZE_VALUE_PROMPT,
+        (False, False): llm_prompts.ZERO_SHOT_NON_MARKET_PROMPT,
+    },
+}
+
 
 def infer_model_source(model_name):
     """
@@ -328,7 +358,7 @@ def get_response_from_together_ai_model(model_name, prompt, max_tokens, temperat
             error_message = str(e)
             if "Input validation error" in error_message:
                 # Extract the number of input tokens from the error message
-                match = re.search(r"Given: (\d+) `inputs` tokens", error_message)
+                match = INPUT_TOKENS_PATTERN.search(error_message)
                 if match:
                     input_tokens = int(match.group(1))
                     # Adjust max_tokens based on the model's limit
@@ -383,6 +413,16 @@ def get_response_from_google_model(model_name, prompt, max_tokens, temperature,
     )
 
 
+RESPONSE_FUNCTIONS_BY_SOURCE = {
+    constants.OAI_SOURCE: get_response_from_oai_model,
+    constants.ANTHROPIC_SOURCE: get_response_from_anthropic_model,
+    constants.TOGETHER_AI_SOURCE: get_response_from_together_ai_model,
+    constants.GOOGLE_SOURCE: get_response_from_google_model,
+    constants.MISTRAL_SOURCE: get_response_from_mistral_model,
+    constants.XAI_SOURCE: get_response_from_xai_model,
+}
+
+
 def get_response_from_model(
     model_name,
     prompt,
@@ -403,31 +443,22 @@ def get_response_from_model(
         wait_time (int, optional): Time to wait before retrying, in seconds.
     """
     model_source = infer_model_source(model_name)
-    if model_source == constants.OAI_SOURCE:
-        return get_response_from_oai_model(
-            model_name, prompt, system_prompt, max_tokens, temperature, wait_time
-        )
-    elif model_source == constants.ANTHROPIC_SOURCE:
-        return get_response_from_anthropic_model(
-            model_name, prompt, max_tokens, temperature, wait_time
-        )
-    elif model_source == constants.TOGETHER_AI_SOURCE:
-        return get_response_from_together_ai_model(
-            model_name, prompt, max_tokens, temperature, wait_time
-        )
-    elif model_source == constants.GOOGLE_SOURCE:
-        return get_response_from_google_model(
-            model_name, prompt, max_tokens, temperature, wait_time
-        )
-    elif model_source == constants.MISTRAL_SOURCE:
-        return get_response_from_mistral_model(
-            model_name, prompt, max_tokens, temperature, wait_time
-        )
-    elif model_source == constants.XAI_SOURCE:
-        return get_response_from_xai_model(model_name, prompt, max_tokens, temperature, wait_time)
-    else:
+    get_response = RESPONSE_FUNCTIONS_BY_SOURCE.get(model_source)
+    if get_response is None:
         return "Not a valid model source."
 
+    # Only the OpenAI path accepts a system prompt (and errors if one is sent).
+    kwargs = {"system_prompt": system_prompt} if model_source == constants.OAI_SOURCE else {}
+    with SOURCE_SEMAPHORES[model_source]:
+        return get_response(
+            model_name=model_name,
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            wait_time=wait_time,
+            **kwargs,
+        )
+
 
 def extract_probability(text):
     """
@@ -448,9 +479,7 @@ def extract_probability(text):
     if text is None:
         return None
 
-    pattern = r"(?:\*\s*)?(\d*\.?\d+)%?(?:\s*\*)?"
-
-    matches = re.findall(pattern, text)
+    matches = PROBABILITY_PATTERN.findall(text)
 
     for match in reversed(matches):
         number = float(match)
@@ -489,13 +518,9 @@ def convert_string_to_list(string_list):
     # Split the string by commas and convert each element to a float
     list_values = string_list.split(",")
 
+    cleaned_values = [value.strip().replace("*", "") for value in list_values]
     actual_list = [
-        (
-            0.5
-            if not re.match(r"^\d*\.\d+$", value.strip().replace("*", ""))
-            else float(value.strip().replace("*", ""))
-        )
-        for value in list_values
+        float(value) if DECIMAL_PATTERN.match(value) else 0.5 for value in cleaned_values
     ]
 
     return actual_list
@@ -599,45 +624,16 @@ def generate_final_forecast_files(forecast_due_date, prompt_type, models, run_mo
     """
     models_to_test = list(models.keys())
 
-    def get_final_dir(with_freeze_values, run_mode):
-        final_dir = "final_with_freeze" if with_freeze_values else "final"
+    def read_forecasts(model, question_type, run_mode):
+        question_type_dir = f"{prompt_type}/{question_type}"
         if run_mode == constants.RunMode.TEST:
-            final_dir += "_test"
-        return final_dir
+            question_type_dir += "_test"
 
-    def write_file(model, with_freeze_values, run_mode):
-        current_model_forecasts = []
-        dataset_dir = f"{prompt_type}/dataset"
-        market_dir = f"{prompt_type}/market"
-        if with_freeze_values:
-            market_dir += "_with_freeze_values"
+        return data_utils.read_jsonl(f"/tmp/{question_type_dir}/{model}.jsonl")
 
-        if run_mode == constants.RunMode.TEST:
-            dataset_dir += "_test"
-            market_dir += "_test"
-
-        dirs = [
-            dataset_dir,
-            market_dir,
-        ]
-        for question_type in dirs:
-            file_path = f"/tmp/{question_type}/{model}.jsonl"
-            questions = data_utils.read_jsonl(file_path)
-            current_model_forecasts.extend(questions)
-
-        final_dir = get_final_dir(with_freeze_values, run_mode)
-
-        final_file_name = f"/tmp/{prompt_type}/{final_dir}/{model}"
-        os.makedirs(os.path.dirname(final_file_name), exist_ok=True)
-        with open(final_file_name, "w") as file:
-            for entry in current_model_forecasts:
-                json_line = json.dumps(entry)
-                file.write(json_line + "\n")
-
-    def create_final_file(model, with_freeze_values, run_mode):
-        final_dir = get_final_dir(with_freeze_values, run_mode)
-        file_path = f"/tmp/{prompt_type}/{final_dir}/{model}"
-        questions = data_utils.read_jsonl(file_path)
+    def create_final_file(model, dataset_forecasts, with_freeze_values, run_mode):
+        market_type = "market_with_freeze_values" if with_freeze_values else "market"
+        questions = dataset_forecasts + read_forecasts(model, market_type, run_mode)
         org = get_model_org(model)
 
         local_submit_dir = get_local_final_submit_directory(
@@ -678,10 +674,15 @@ def generate_final_forecast_files(forecast_due_date, prompt_type, models, run_mo
             json.dump(forecast_file, f, indent=4)
 
     for model in models_to_test:
-        write_file(model=model, with_freeze_values=True, run_mode=run_mode)
-        create_final_file(model=model, with_freeze_values=True, run_mode=run_mode)
-        write_file(model=model, with_freeze_values=False, run_mode=run_mode)
-        create_final_file(model=model, with_freeze_values=False, run_mode=run_mode)
+        # Dataset forecasts are shared by both final files, so only read them once
+        dataset_forecasts = read_forecasts(model=model, question_type="dataset", run_mode=run_mode)
+        for with_freeze_values in [True, False]:
+            create_final_file(
+                model=model,
+                dataset_forecasts=dataset_forecasts,
+                with_freeze_values=with_freeze_values,
+                run_mode=run_mode,
+            )
 
 
 def worker(
@@ -715,20 +716,7 @@ def worker(
         # because we will have already run these requests when it was False.
         return
 
-    if is_market_question:
-        if market_use_freeze_value:
-            prompt = {
-                "zero_shot": llm_prompts.ZERO_SHOT_MARKET_WITH_FREEZE_VALUE_PROMPT,
-            }.get(prompt_type)
-        else:
-            prompt = {
-                "zero_shot": llm_prompts.ZERO_SHOT_MARKET_PROMPT,
-            }.get(prompt_type)
-    else:
-        prompt = {
-            "zero_shot": llm_prompts.ZERO_SHOT_NON_MARKET_PROMPT,
-        }.get(prompt_type)
-
+    prompt = PROMPT_TEMPLATES[prompt_type][(is_market_question, market_use_freeze_value)]
     prompt = prompt.format(
         **get_prompt_params(
             question,
@@ -754,24 +742,16 @@ def worker(
         logger.error(f"Error in worker: {e}")
         response = None
 
-    if prompt_type == "zero_shot":
-        if is_market_question:
-            save_dict[index] = {"forecast": extract_probability(response)}
-        else:
-            save_dict[index] = {
-                "forecast": reformat_answers(response=response, prompt=prompt, question=question)
-            }
+    if not is_market_question:
+        forecast = reformat_answers(response=response, prompt=prompt, question=question)
+    elif prompt_type == "zero_shot":
+        forecast = extract_probability(response)
     else:
-        if is_market_question:
-            save_dict[index] = {
-                "forecast": reformat_answers(response=response, single=True),
-                "reasoning": response,
-            }
-        else:
-            save_dict[index] = {
-                "forecast": reformat_answers(response=response, prompt=prompt, question=question),
-                "reasoning": response,
-            }
+        forecast = reformat_answers(response=response, single=True)
+
+    save_dict[index] = {"forecast": forecast}
+    if prompt_type != "zero_shot":
+        save_dict[index]["reasoning"] = response
 
     prompt_col = colored(prompt_type, "red", attrs=["bold"])
     question_type_col = colored("Market" if is_market_question else "Dataset", "yellow")
@@ -805,10 +785,11 @@ def executor(
     market_use_freeze_value=False,
 ):
     """Executor function."""
+    n_questions = len(questions_to_eval)
     with ThreadPoolExecutor(max_workers=env.NUM_CPUS) as executor:
         worker_with_args = partial(
             worker,
-            n_questions=len(questions_to_eval),
+            n_questions=n_questions,
             model_name=model_name,
             save_dict=save_dict,
             questions_to_eval=questions_to_eval,
@@ -816,7 +797,11 @@ def executor(
             prompt_type=prompt_type,
             market_use_freeze_value=market_use_freeze_value,
         )
-        return list(executor.map(worker_with_args, range(len(questions_to_eval))))
+        futures = [executor.submit(worker_with_args, index) for index in range(n_questions)]
+        for n_done, future in enumerate(as_completed(futures), start=1):
+            future.result()
+            if n_done % 10 == 0 or n_done == n_questions:
+                logger.info(f"{model_name}: {n_done}/{n_questions} questions done.")
 
 
 def get_all_retrieved_info(all_retrieved_info):
@@ -953,18 +938,21 @@ def generate_forecasts(model, results, questions_to_eval, prompt_type):
 
 def generate_data_source_forecasts(model, results, question, index, prompt_type):
     """Generate forecasts for questions from data sources."""
-    forecasts = []
-    model_results = results[model][index]["forecast"]
-    for forecast, resolution_date in zip(model_results, question["resolution_dates"]):
-        forecast_data = {
-            "id": question["id"],
-            "source": question["source"],
+    question_id = question["id"]
+    source = question["source"]
+    reasoning = None if prompt_type == "zero_shot" else results[model][index]["reasoning"]
+    return [
+        {
+            "id": question_id,
+            "source": source,
             "forecast": forecast,
             "resolution_date": resolution_date,
-            "reasoning": None if prompt_type == "zero_shot" else results[model][index]["reasoning"],
+            "reasoning": reasoning,
         }
-        forecasts.append(forecast_data)
-    return forecasts
+        for forecast, resolution_date in zip(
+            results[model][index]["forecast"], question["resolution_dates"]
+        )
+    ]
 
 
 def generate_non_data_source_forecast(model, results, question, index, prompt_type):
@@ -984,9 +972,7 @@ def save_and_upload_results(forecasts, test_type, model, base_file_path):
     local_filename = f"/tmp/{test_type}/{model}.jsonl"
     os.makedirs(os.path.dirname(local_filename), exist_ok=True)
     with open(local_filename, "w") as file:
-        for entry in forecasts:
-            json_line = json.dumps(entry)
-            file.write(json_line + "\n")
+        file.writelines(json.dumps(entry) + "\n" for entry in forecasts)
 
     remote_filename = local_filename.replace("/tmp/", "")
     gcp.storage.upload(
@@ -48,6 +48,8 @@ DATA_SOURCES = sorted(
 
 ALL_SOURCES = MARKET_SOURCES + DATA_SOURCES
 
+ISO_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
 
 def split_dataframe_on_source(df, source):
     """Return tuple of this data source from dataframe and everything else."""
@@ -430,7 +432,7 @@ def read_forecast_file(filename: str, f: Optional[TextIO] = None) -> Dict[str, A
     model = data.get("model")
     model_organization = data.get("model_organization")
     question_set = data.get("question_set")
-    date_match = re.search(r"\d{4}-\d{2}-\d{2}", question_set)
+    date_match = ISO_DATE_PATTERN.search(question_set)
     forecast_due_date = date_match.group(0) if date_match else None
     forecasts = data.get("forecasts")
     if not organization or not model or not model_organization or not question_set or not forecasts:
@@ -1,6 +1,7 @@
 """Slack API."""
 
 import logging
+from functools import cache
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
@@ -11,9 +12,15 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@cache
+def get_client():
+    """Return a Slack client, created on first use and shared across calls."""
+    return WebClient(token=keys.API_SLACK_BOT_NOTIFICATION)
+
+
 def send_message(message=""):
     """Send a slack message."""
-    client = WebClient(token=keys.API_SLACK_BOT_NOTIFICATION)
+    client = get_client()
 
     try:
         client.chat_postMessage(channel=keys.API_SLACK_BOT_CHANNEL, text=message)
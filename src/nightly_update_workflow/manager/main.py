@@ -32,7 +32,8 @@ def summarize_question_bank():
         f"gs://{env.QUESTION_BANK_BUCKET}/{constants.META_DATA_FILENAME}",
         lines=True,
     )
-    df = pd.DataFrame()
+    dfmeta = dfmeta[dfmeta["valid_question"]]
+    rows = []
     for source in sorted(question_curation.ALL_SOURCES):
         logger.info(f"downloading {source} question file.")
         dfq = pd.read_json(
@@ -40,34 +41,17 @@ def summarize_question_bank():
             lines=True,
             convert_dates=False,
         )
-        dfq = dfq[~dfq["resolved"]].reset_index(drop=True)
-        dfq["source"] = source
-        dfq["id"] = dfq["id"].astype(str)
-
-        dfq_valid = pd.merge(
-            dfq,
-            dfmeta,
-            how="inner",
-            on=["id", "source"],
-        )
-        dfq_valid = dfq_valid[dfq_valid["valid_question"]]
-
-        df = pd.concat(
-            [
-                df,
-                pd.DataFrame(
-                    [
-                        {
-                            "source": source,
-                            "N unresolved": len(dfq),
-                            "N valid unresolved": len(dfq_valid),
-                        }
-                    ]
-                ),
-            ],
-            ignore_index=True,
+        unresolved_ids = dfq.loc[~dfq["resolved"], "id"].astype(str)
+        valid_ids = dfmeta.loc[dfmeta["source"] == source, "id"]
+        rows.append(
+            {
+                "source": source,
+                "N unresolved": len(unresolved_ids),
+                "N valid unresolved": unresolved_ids.isin(valid_ids).sum(),
+            }
         )
 
+    df = pd.DataFrame(rows)
     sum_row = {
         col: df[col].sum() if pd.api.types.is_numeric_dtype(df[col]) else "Total"
         for col in df.columns
@@ -140,7 +140,7 @@ def driver(_: Any) -> None:
         return
 
     with open(filenames["local_fetch"], "w", encoding="utf-8") as f:
-        for record in df.to_dict(orient="records"):
+        for record in data_utils.iter_records(df):
             jsonl_str = json.dumps(record, ensure_ascii=False)
             f.write(jsonl_str + "\n")
 
@@ -103,16 +103,16 @@ def generate_forecast_questions(dfq, dfr, countries, event_types):
     dfq = pd.concat([dfq, rows_to_append], ignore_index=True).sort_values(
         by="id", ignore_index=True
     )
-    rows_to_update = df[df["id"].isin(dfq["id"])]
     fields_to_update = [
         "question",
         "background",
         "freeze_datetime_value",
         "freeze_datetime_value_explanation",
     ]
-    for aid in rows_to_update["id"].unique():
-        for field in fields_to_update:
-            dfq.loc[dfq["id"] == aid, field] = df.loc[df["id"] == aid, field].iloc[0]
+    df_updates = df.drop_duplicates(subset="id").set_index("id")
+    update_mask = dfq["id"].isin(df_updates.index)
+    for field in fields_to_update:
+        dfq.loc[update_mask, field] = dfq.loc[update_mask, "id"].map(df_updates[field])
     return dfq
 
 
@@ -133,7 +133,7 @@ def driver(_):
 
     # Save
     with open(filenames["local_question"], "w", encoding="utf-8") as f:
-        for record in dfq.to_dict(orient="records"):
+        for record in data_utils.iter_records(dfq):
             jsonl_str = json.dumps(record, ensure_ascii=False)
             f.write(jsonl_str + "\n")
 
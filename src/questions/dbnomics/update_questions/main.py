@@ -55,13 +55,14 @@ def create_resolution_file(id, df):
 def _construct_questions(dff, dfq):
     """Construct question and resolution tables."""
     # For each seriesIds, construct question data from request
-    new_series = None
+    new_series = []
     for row in dbnomics.CONSTANTS:
         id = row["id"].replace("/", "_")
-        create_resolution_file(id, df=dff[dff["id"] == id])
-        provider_name = dff[dff["id"] == id]["provider_name"].iloc[0]
-        dataset_name = dff[dff["id"] == id]["dataset_name"].iloc[0]
-        series_name = dff[dff["id"] == id]["series_name"].iloc[0]
+        dff_id = dff[dff["id"] == id]
+        create_resolution_file(id, df=dff_id)
+        provider_name = dff_id["provider_name"].iloc[0]
+        dataset_name = dff_id["dataset_name"].iloc[0]
+        series_name = dff_id["series_name"].iloc[0]
         question = row["question_text"]
         url = f"https://db.nomics.world/{row['id']}"
         background = (
@@ -69,8 +70,8 @@ def _construct_questions(dff, dfq):
             f"{url}."
         )
         freeze_datetime_value_explanation = row["freeze_datetime_value_explanation"]
-        series_values = dff[dff["id"] == id]["value"]
-        series_dates = pd.to_datetime(dff[dff["id"] == id]["period"])
+        series_values = dff_id["value"]
+        series_dates = pd.to_datetime(dff_id["period"])
 
         last_fetch_date = series_dates.iloc[-1]
         last_fetch_value = series_values.iloc[-1]
@@ -95,13 +96,8 @@ def _construct_questions(dff, dfq):
                 "freeze_datetime_value": freeze_datetime_value,
                 "freeze_datetime_value_explanation": freeze_datetime_value_explanation,
             }
-            new_row = pd.DataFrame([new_row])
-            if id not in dfq["id"].tolist():
-                new_series = (
-                    new_row
-                    if new_series is None
-                    else pd.concat([new_series, new_row], ignore_index=True)
-                )
+            if id not in dfq["id"].values:
+                new_series.append(new_row)
             else:
                 dfq.loc[dfq["id"] == id, "freeze_datetime_value"] = float(
                     series_values[series_values != "NA"].iloc[-1]
@@ -109,8 +105,7 @@ def _construct_questions(dff, dfq):
                 dfq.loc[dfq["id"] == id, "url"] = url
                 dfq.loc[dfq["id"] == id, "background"] = background
 
-    new_series = new_series if new_series is not None else pd.DataFrame()
-    return new_series
+    return pd.DataFrame(new_series)
 
 
 @decorator.log_runtime
@@ -139,7 +134,7 @@ def driver(_):
 
     # Save
     with open(filenames["local_question"], "w", encoding="utf-8") as f:
-        for record in dfq.to_dict(orient="records"):
+        for record in data_utils.iter_records(dfq):
             jsonl_str = json.dumps(record, ensure_ascii=False)
             f.write(jsonl_str + "\n")
 
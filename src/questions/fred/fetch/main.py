@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import sys
+from collections import defaultdict
 from datetime import datetime, timedelta
 
 import backoff
@@ -222,21 +223,14 @@ def fetch_all_observations(params, series_id):
 
 def combine_dicts(dict1, dict2):
     """Combine 2 dict."""
-    combined_dict = {}
+    combined_dict = defaultdict(dict)
 
-    # Add all keys from dict1 to combined_dict
-    for key, value in dict1.items():
-        if key not in combined_dict:
-            combined_dict[key] = {}
-        combined_dict[key].update(value)
+    # Add all keys from dict1 and dict2 to combined_dict, merging nested dictionaries
+    for d in (dict1, dict2):
+        for key, value in d.items():
+            combined_dict[key].update(value)
 
-    # Add all keys from dict2 to combined_dict, merging nested dictionaries
-    for key, value in dict2.items():
-        if key not in combined_dict:
-            combined_dict[key] = {}
-        combined_dict[key].update(value)
-
-    return combined_dict
+    return dict(combined_dict)
 
 
 def fetch_all(dfq, FRED_QUESTIONS_NAMES):
@@ -318,6 +312,7 @@ def fetch_all(dfq, FRED_QUESTIONS_NAMES):
         del combined_questions[id]
 
     series_list = []
+    fetch_datetime = dates.get_datetime_now()
 
     for series_id in tqdm(combined_questions.keys(), desc="Saving fetched FRED data"):
         observations = combined_questions[series_id]["observations"]
@@ -359,7 +354,7 @@ def fetch_all(dfq, FRED_QUESTIONS_NAMES):
                 "url": f"https://fred.stlouisfed.org/series/{series_id}",
                 "resolved": False,
                 "market_info_resolution_datetime": "N/A",
-                "fetch_datetime": dates.get_datetime_now(),
+                "fetch_datetime": fetch_datetime,
                 "probability": current_value,
                 "forecast_horizons": (
                     constants.FORECAST_HORIZONS_IN_DAYS
@@ -394,7 +389,7 @@ def driver(_):
     # Save and upload
     with open(filenames["local_fetch"], "w", encoding="utf-8") as f:
         # can't use `dfq.to_json` because we don't want escape chars
-        for record in all_questions.to_dict("records"):
+        for record in data_utils.iter_records(all_questions):
             json_str = json.dumps(record, ensure_ascii=False)
             f.write(json_str + "\n")
 
@@ -65,6 +65,7 @@ def update_questions(dfq, dff):
     It also appends new series to dfr for each question in all_questions_to_add.
     """
     dff_list = dff.to_dict("records")
+    questions = []
 
     for question in dff_list:
         create_resolution_file(question, SOURCE)
@@ -73,19 +74,9 @@ def update_questions(dfq, dff):
         del question["probability"]
         del question["resolutions"]
 
-        # Check if the question exists in dfq
-        if question["id"] in dfq["id"].values:
-            # Case 1: Update existing question
-            dfq_index = dfq.index[dfq["id"] == question["id"]].tolist()[0]
-            for key, value in question.items():
-                dfq.at[dfq_index, key] = value
-        else:
-            # Case 2: Append new question
-            new_q_row = pd.DataFrame([question])
-            new_q_row = new_q_row.astype(constants.QUESTION_FILE_COLUMN_DTYPE)
-            dfq = pd.concat([dfq, new_q_row], ignore_index=True)
-
-    return dfq
+        questions.append(question)
+
+    return data_utils.upsert_questions(dfq, questions, dtype=constants.QUESTION_FILE_COLUMN_DTYPE)
 
 
 @decorator.log_runtime
@@ -4,11 +4,15 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import backoff
 import certifi
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))
 from helpers import data_utils, dates, decorator, env, keys  # noqa: E402
@@ -21,6 +25,16 @@ logger = logging.getLogger(__name__)
 
 SOURCE = "infer"
 INFER_URL = "https://www.randforecastinginitiative.org"
+PAGES_PER_BATCH = 8
+
+# Reuse authenticated connections across all question pages, keeping one per concurrent page
+session = requests.Session()
+session.headers.update({"Authorization": f"Bearer {keys.API_KEY_INFER}"})
+session.verify = certifi.where()
+session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=PAGES_PER_BATCH, max_retries=2),
+)
 
 
 @backoff.on_exception(
@@ -29,13 +43,23 @@ INFER_URL = "https://www.randforecastinginitiative.org"
     max_time=300,
     on_backoff=data_utils.print_error_info_handler,
 )
+def _get_questions_page(endpoint, params, page):
+    """Fetch a single page of questions."""
+    params = {**params, "page": page}
+    response = session.get(endpoint, params=params)
+    if not response.ok:
+        logger.error(f"Request to Infer questions endpoint failed with params: {params}")
+        response.raise_for_status()
+    return orjson.loads(response.content).get("questions", [])
+
+
 def fetch_questions(potentially_closed_ids=None):
     """
     Fetch all questions from a specified API endpoint.
 
     Iterates over pages of questions from the given base URL, authenticating
-    with the provided headers. Continues fetching until no more questions are
-    available.
+    with the session headers. Pages are requested `PAGES_PER_BATCH` at a time and
+    fetching continues until an empty page is returned.
 
     Parameters:
     - potentially_closed_ids (dict): ids for questions that may or may not have been closed.
@@ -44,9 +68,7 @@ def fetch_questions(potentially_closed_ids=None):
     - list: A list of all questions fetched from the API.
     """
     endpoint = INFER_URL + "/api/v1/questions"
-    headers = {"Authorization": f"Bearer {keys.API_KEY_INFER}"}
     params = {
-        "page": 0,
         "status": "active",
     }
     if potentially_closed_ids is not None:
@@ -57,26 +79,28 @@ def fetch_questions(potentially_closed_ids=None):
             }
         )
 
-    questions = []
-    seen_ids = set()
-    while True:
-        response = requests.get(endpoint, params=params, headers=headers, verify=certifi.where())
-        if not response.ok:
-            logger.error(f"Request to Infer questions endpoint failed with params: {params}")
-            response.raise_for_status()
+    # Keyed by id so questions repeated across pages are only kept once, in the order first seen
+    questions = {}
+    page = 0
+    with ThreadPoolExecutor(max_workers=PAGES_PER_BATCH) as executor:
+        while True:
+            pages = executor.map(
+                partial(_get_questions_page, endpoint, params),
+                range(page, page + PAGES_PER_BATCH),
+            )
+            for new_questions in pages:
+                if not new_questions:
+                    return list(questions.values())
 
-        new_questions = response.json().get("questions", [])
-        if not new_questions:
-            break
+                for q in new_questions:
+                    questions.setdefault(q["id"], q)
 
-        for q in new_questions:
-            if q["id"] not in seen_ids:
-                questions.append(q)
-                seen_ids.add(q["id"])
+            page += PAGES_PER_BATCH
 
-        params["page"] += 1
 
-    return questions
+def _earliest_datetime_str(*datetime_strs):
+    """Return the earliest of the ISO datetime strings that are available, or "N/A" if none are."""
+    return min((d for d in datetime_strs if d != "N/A"), default="N/A")
 
 
 def get_data(dfq):
@@ -104,8 +128,8 @@ def get_data(dfq):
     logger.info(f"Number resolved_ids: {len(resolved_ids)}")
     logger.info(f"Number unresolved_ids: {len(unresolved_ids)}")
 
-    files_in_storage = gcp.storage.list_with_prefix(
-        bucket_name=env.QUESTION_BANK_BUCKET, prefix=SOURCE
+    files_in_storage = set(
+        gcp.storage.list_with_prefix(bucket_name=env.QUESTION_BANK_BUCKET, prefix=SOURCE)
     )
 
     resolved_ids_without_files_in_storage = [
@@ -156,19 +180,7 @@ def get_data(dfq):
             else "N/A"
         )
         ended_at_str = dates.convert_zulu_to_iso(q["ends_at"]) if q["ends_at"] else "N/A"
-        final_closed_at_str = (
-            "N/A"
-            if scoring_end_time_str == "N/A" and ended_at_str == "N/A"
-            else (
-                ended_at_str
-                if scoring_end_time_str == "N/A"
-                else (
-                    scoring_end_time_str
-                    if ended_at_str == "N/A"
-                    else min(scoring_end_time_str, ended_at_str)
-                )
-            )
-        )
+        final_closed_at_str = _earliest_datetime_str(scoring_end_time_str, ended_at_str)
 
         scoring_start_time_str = (
             dates.convert_datetime_str_to_iso_utc(q["scoring_start_time"])
@@ -176,19 +188,8 @@ def get_data(dfq):
             else "N/A"
         )
         resolved_at_str = dates.convert_zulu_to_iso(q["resolved_at"]) if q["resolved_at"] else "N/A"
-        final_resolved_str = (
-            "N/A"
-            if resolved_at_str == "N/A" and final_closed_at_str == "N/A"
-            else (
-                final_closed_at_str
-                if resolved_at_str == "N/A"
-                else (
-                    resolved_at_str
-                    if final_closed_at_str == "N/A"
-                    else min(resolved_at_str, final_closed_at_str)
-                )
-            )
-        )
+        final_resolved_str = _earliest_datetime_str(resolved_at_str, final_closed_at_str)
+        is_resolved = q.get("resolved?", False)
 
         forecast_yes = "N/A"
         if len(q["answers"]) == 2 and not nullify_question:
@@ -208,10 +209,8 @@ def get_data(dfq):
                 "market_info_open_datetime": scoring_start_time_str,
                 "market_info_close_datetime": final_closed_at_str,
                 "url": f"{INFER_URL}/questions/{q['id']}",
-                "resolved": q.get("resolved?", False),
-                "market_info_resolution_datetime": (
-                    "N/A" if not q.get("resolved?", False) else final_resolved_str
-                ),
+                "resolved": is_resolved,
+                "market_info_resolution_datetime": final_resolved_str if is_resolved else "N/A",
                 "fetch_datetime": current_time,
                 "probability": forecast_yes,
                 "forecast_horizons": "N/A",
@@ -238,7 +237,7 @@ def driver(_):
     # Save and upload
     with open(filenames["local_fetch"], "w", encoding="utf-8") as f:
         # can't use `dfq.to_json` because we don't want escape chars
-        for record in all_questions_to_add.to_dict(orient="records"):
+        for record in data_utils.iter_records(all_questions_to_add):
             json_str = json.dumps(record, ensure_ascii=False)
             f.write(json_str + "\n")
 
@@ -22,6 +22,11 @@ logger = logging.getLogger(__name__)
 endpoint = "https://www.randforecastinginitiative.org/api/v1/prediction_sets"
 SOURCE = "infer"
 
+# Reuse one authenticated connection across all prediction set pages and questions
+session = requests.Session()
+session.headers.update({"Authorization": f"Bearer {keys.API_KEY_INFER}"})
+session.verify = certifi.where()
+
 
 def get_historical_forecasts(current_df, id):
     """
@@ -39,7 +44,6 @@ def get_historical_forecasts(current_df, id):
         pd.DataFrame: A DataFrame containing combined old and new forecast data, sorted.
     """
     params = {"question_id": id, "page": 0}
-    headers = {"Authorization": f"Bearer {keys.API_KEY_INFER}"}
     all_responses = []
     current_time = dates.get_datetime_today_midnight()
 
@@ -53,9 +57,7 @@ def get_historical_forecasts(current_df, id):
     while True:
         try:
             logger.info(f"Fetched page: {params['page']}, for question ID: {id}")
-            response = requests.get(
-                endpoint, params=params, headers=headers, verify=certifi.where()
-            )
+            response = session.get(endpoint, params=params)
             response.raise_for_status()
             new_responses = response.json().get("prediction_sets", [])
             all_responses.extend(new_responses)
@@ -74,7 +76,8 @@ def get_historical_forecasts(current_df, id):
 
     all_forecasts = []
     for forecast in all_responses:
-        if current_df.empty or pd.to_datetime(forecast["created_at"], utc=True) > last_date:
+        created_at = dates.convert_zulu_to_datetime(forecast["created_at"])
+        if current_df.empty or created_at > last_date:
             if len(forecast["predictions"]) == 2:
                 forecast_yes = forecast["predictions"][0]
                 if forecast_yes["answer_name"] == "No":
@@ -82,12 +85,7 @@ def get_historical_forecasts(current_df, id):
             elif len(forecast["predictions"]) == 1:
                 forecast_yes = forecast["predictions"][0]
 
-            all_forecasts.append(
-                (
-                    dates.convert_zulu_to_iso(forecast["created_at"]),
-                    forecast_yes["final_probability"],
-                )
-            )
+            all_forecasts.append((created_at, forecast_yes["final_probability"]))
 
     df = pd.DataFrame(all_forecasts, columns=["date", "value"])
     df["date"] = pd.to_datetime(df["date"])
@@ -249,6 +247,7 @@ def update_questions(dfq, dff):
     The function updates dfq by either replacing existing questions with new data or adding new questions.
     It also appends new community predictions to dfr for each question in all_questions_to_add.
     """
+    questions = []
     for question in dff.to_dict("records"):
         create_resolution_file(question, question["resolved"])
 
@@ -260,18 +259,9 @@ def update_questions(dfq, dff):
         del question["probability"]
         del question["nullify_question"]
 
-        # Check if the question exists in dfq
-        if question["id"] in dfq["id"].values:
-            # Case 1: Update existing question
-            dfq_index = dfq.index[dfq["id"] == question["id"]].tolist()[0]
-            for key, value in question.items():
-                dfq.at[dfq_index, key] = value
-        else:
-            # Case 2: Append new question
-            new_q_row = pd.DataFrame([question])
-            dfq = pd.concat([dfq, new_q_row], ignore_index=True)
+        questions.append(question)
 
-    return dfq
+    return data_utils.upsert_questions(dfq, questions)
 
 
 @decorator.log_runtime
@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import backoff
 import certifi
@@ -29,7 +30,7 @@ MANIFOLD_TOPIC_SLUGS = ["entertainment", "sports-default", "technology-default"]
     max_time=500,
     on_backoff=data_utils.print_error_info_handler,
 )
-def _call_endpoint(ids, additional_params=None):
+def _call_endpoint(additional_params=None):
     """Get the top 100 markets from Manifold Markets."""
     endpoint = "https://api.manifold.markets/v0/search-markets"
     params = {
@@ -50,16 +51,15 @@ def _call_endpoint(ids, additional_params=None):
         )
         response.raise_for_status()
 
-    ids.update(market["id"] for market in response.json())
-    return ids
+    return {market["id"] for market in response.json()}
 
 
 def _get_data():
     """Get pertinent Manifold questions and data."""
     logger.info("Calling Manifold search-markets endpoint")
-    ids = _call_endpoint(set())
-    for topic in MANIFOLD_TOPIC_SLUGS:
-        ids = _call_endpoint(ids, {"topicSlug": topic})
+    all_params = [None] + [{"topicSlug": topic} for topic in MANIFOLD_TOPIC_SLUGS]
+    with ThreadPoolExecutor(max_workers=len(all_params)) as executor:
+        ids = set().union(*executor.map(_call_endpoint, all_params))
     return sorted(ids)
 
 
@@ -23,6 +23,10 @@ logger = logging.getLogger(__name__)
 source = "manifold"
 filenames = data_utils.generate_filenames(source=source)
 
+# Reuse one connection to the Manifold API across the market and bets requests
+session = requests.Session()
+session.verify = certifi.where()
+
 
 @backoff.on_exception(
     backoff.expo,
@@ -37,7 +41,7 @@ def _get_market(market_id):
     """Get the market description and close time for the specified market."""
     logger.info(f"Calling market endpoint for {market_id}")
     endpoint = f"https://api.manifold.markets/v0/market/{market_id}"
-    response = requests.get(endpoint, verify=certifi.where())
+    response = session.get(endpoint)
     if not response.ok:
         logger.error(f"Request to market endpoint failed for {market_id}.")
         response.raise_for_status()
@@ -69,7 +73,7 @@ def _get_market_forecasts(market_id):
         n_requests += 1
         if n_requests % 100 == 0:
             logger.info(f"Request number {n_requests} for {market_id}.")
-        response = requests.get(endpoint, params=params, verify=certifi.where())
+        response = session.get(endpoint, params=params)
         if not response.ok:
             logger.error(f"Request to bets endpoint failed for {market_id}.")
             response.raise_for_status()
@@ -259,11 +263,11 @@ def _update_questions_and_resolved_values(dfq, dff):
     # Upload dfq before checking resolved questions in case we hit rate limit
     data_utils.upload_questions(dfq, source)
 
+    # Regenerate resolution files in case they've been deleted
+    resolved_files = set(
+        gcp.storage.list_with_prefix(bucket_name=env.QUESTION_BANK_BUCKET, prefix=source)
+    )
     for index, row in dfq[dfq["resolved"]].iterrows():
-        # Regenerate resolution files in case they've been deleted
-        resolved_files = gcp.storage.list_with_prefix(
-            bucket_name=env.QUESTION_BANK_BUCKET, prefix=source
-        )
         filename = f"{row['id']}.jsonl"
         if filename not in resolved_files:
             market = _get_market(row["id"])
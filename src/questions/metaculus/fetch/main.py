@@ -4,11 +4,13 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import backoff
 import certifi
 import requests
+from requests.adapters import HTTPAdapter
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))
 from helpers import (  # noqa: E402
@@ -31,6 +33,23 @@ filenames = data_utils.generate_filenames(source="metaculus")
 
 MIN_NUM_FORECASTERS_ON_MARKET = 50
 
+ENDPOINT = "https://www.metaculus.com/api/posts/"
+BASE_PARAMS = {
+    "statuses": "open",
+    "with_cp": "false",
+    "forecast_type": "binary",
+    "order_by": "-hotness",
+    "limit": 150,  # not listed as a parameter but valid
+    "for_main_feed": "true",  # not listed as a parameter but valid
+}
+
+# One pooled connection per concurrent call in `get_data()`: the unfiltered call plus one per topic
+N_CONCURRENT_CALLS = len(metaculus.CATEGORIES) + 1
+session = requests.Session()
+session.headers.update({"Authorization": f"Token {keys.API_KEY_METACULUS}"})
+session.verify = certifi.where()
+session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=N_CONCURRENT_CALLS))
+
 
 @backoff.on_exception(
     backoff.expo,
@@ -41,24 +60,18 @@ MIN_NUM_FORECASTERS_ON_MARKET = 50
 def call_endpoint(additional_params=None):
     """Get the top 100 markets from Metaculus."""
     ids = set()
-    endpoint = "https://www.metaculus.com/api/posts/"
+    today = dates.get_date_today()
     params = {
-        "statuses": "open",
-        "with_cp": "false",
+        **BASE_PARAMS,
         "scheduled_resolve_time__gt": (
-            dates.get_date_today() + timedelta(days=question_curation.FREEZE_WINDOW_IN_DAYS)
+            today + timedelta(days=question_curation.FREEZE_WINDOW_IN_DAYS)
         ).strftime("%Y-%m-%d"),
-        "forecast_type": "binary",
-        "order_by": "-hotness",
-        "limit": 150,  # not listed as a parameter but valid
-        "for_main_feed": "true",  # not listed as a parameter but valid
     }
     if additional_params:
         params.update(additional_params)
-    logger.info(f"Calling {endpoint} with additional params {additional_params}")
+    logger.info(f"Calling {ENDPOINT} with additional params {additional_params}")
 
-    headers = {"Authorization": f"Token {keys.API_KEY_METACULUS}"}
-    response = requests.get(endpoint, params=params, headers=headers, verify=certifi.where())
+    response = session.get(ENDPOINT, params=params)
     if not response.ok:
         logger.error("Request to Metaculus API endpoint failed.")
         response.raise_for_status()
@@ -68,7 +81,7 @@ def call_endpoint(additional_params=None):
             if "cp_reveal_time" in market["question"]:
                 cp_reveal_date = market["question"]["cp_reveal_time"]
                 cp_reveal_date = datetime.strptime(cp_reveal_date[:10], "%Y-%m-%d").date()
-                if cp_reveal_date < dates.get_date_today():
+                if cp_reveal_date < today:
                     ids.add(str(market["id"]))
     return ids
 
@@ -76,9 +89,9 @@ def call_endpoint(additional_params=None):
 def get_data():
     """Get pertinent Metaculus questions and data."""
     logger.info("Calling Metaculus search-markets endpoint")
-    ids = call_endpoint()
-    for topic in metaculus.CATEGORIES:
-        ids = ids.union(call_endpoint(additional_params={"categories": topic}))
+    all_params = [None] + [{"categories": topic} for topic in metaculus.CATEGORIES]
+    with ThreadPoolExecutor(max_workers=N_CONCURRENT_CALLS) as executor:
+        ids = set().union(*executor.map(call_endpoint, all_params))
     return sorted(ids)
 
 
@@ -45,6 +45,9 @@ N_API_CALLS = 0
 # * e.g. https://www.metaculus.com/questions/1535/
 MAX_PANDAS_TS = pd.Timestamp.max.tz_localize("UTC")
 
+ENDPOINT = "https://www.metaculus.com/api/posts/"
+HEADERS = {"Authorization": f"Token {keys.API_KEY_METACULUS}"}
+
 
 @backoff.on_exception(
     backoff.expo,
@@ -57,9 +60,7 @@ def _get_market(market_id):
     global N_API_CALLS
     N_API_CALLS += 1
     logger.info(f"Calling market endpoint for {market_id}. This is API call number {N_API_CALLS}.")
-    endpoint = f"https://www.metaculus.com/api/posts/{market_id}"
-    headers = {"Authorization": f"Token {keys.API_KEY_METACULUS}"}
-    response = requests.get(endpoint, headers=headers, verify=certifi.where())
+    response = requests.get(f"{ENDPOINT}{market_id}", headers=HEADERS, verify=certifi.where())
     if response.status_code == 429:
         retry_after = response.headers.get("Retry-After")
         wait = None
@@ -315,11 +316,11 @@ def _update_questions_and_resolved_values(dfq, dff):
     # Upload dfq before checking resolved questions in case we hit rate limit
     data_utils.upload_questions(dfq, source)
 
+    # Regenerate resolution files in case they've been deleted
+    resolved_files = set(
+        gcp.storage.list_with_prefix(bucket_name=env.QUESTION_BANK_BUCKET, prefix=source)
+    )
     for index, row in dfq[dfq["resolved"]].iterrows():
-        # Regenerate resolution files in case they've been deleted
-        resolved_files = gcp.storage.list_with_prefix(
-            bucket_name=env.QUESTION_BANK_BUCKET, prefix=source
-        )
         filename = f"{row['id']}.jsonl"
         if filename not in resolved_files:
             market = _get_market(row["id"])
@@ -415,7 +415,7 @@ def driver(_):
 
     # Save and upload
     with open(filenames["local_fetch"], "w", encoding="utf-8") as f:
-        for record in all_questions_to_add.to_dict(orient="records"):
+        for record in data_utils.iter_records(all_questions_to_add):
             json_str = json.dumps(record, ensure_ascii=False)
             f.write(json_str + "\n")
 
@@ -1,5 +1,7 @@
 """Fetch data from Wikipedia."""
 
+import hashlib
+import json
 import logging
 import os
 import sys
@@ -18,7 +20,7 @@ from tqdm import tqdm
 from urllib3.util.retry import Retry
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "../../.."))
-from helpers import data_utils, decorator, env, wikipedia  # noqa: E402
+from helpers import data_utils, dates, decorator, env, wikipedia  # noqa: E402
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "../../../.."))
 from utils import gcp  # noqa: E402
@@ -29,6 +31,20 @@ logger = logging.getLogger(__name__)
 source = "wikipedia"
 filenames = data_utils.generate_filenames(source=source)
 
+# Page settings that determine how a revision is parsed into a table. Previously-fetched tables are
+# only reused if these match the settings they were fetched with.
+PARSE_SETTINGS_KEYS = [
+    "page_title",
+    "table_index",
+    "table_keep_first_n_rows",
+    "fields",
+    "resolution_file_value_column_dtype",
+]
+
+# Download the full edit history on this day of the week (Sunday) regardless of the previous
+# fetch, so that fixes to the parsing code also apply to past revisions.
+FULL_DOWNLOAD_WEEKDAY = 6
+
 
 def make_session():
     """Make a session for requests."""
@@ -120,6 +136,68 @@ def download_wikipedia_table(page_title, edit_date, revid, table_index, session)
     return tables[ti] if isinstance(ti, int) else pd.concat([tables[i] for i in ti])
 
 
+def get_parse_settings_filename(page):
+    """Provide the name of the file storing the parse settings hash for the page's fetch file."""
+    return f"{page.get('id_root')}.parse_settings.json"
+
+
+def get_parse_settings_hash(page):
+    """Hash the page settings that determine how its tables are parsed."""
+    settings = {key: page.get(key) for key in PARSE_SETTINGS_KEYS}
+    settings_str = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha256(settings_str.encode("utf-8")).hexdigest()
+
+
+def get_previous_parse_settings_hash(page):
+    """Return the parse settings hash stored with the last fetch, or None if there isn't one."""
+    settings_filename = get_parse_settings_filename(page)
+    local_filename = f"/tmp/previous_{settings_filename}"
+    gcp.storage.download_no_error_message_on_404(
+        bucket_name=env.QUESTION_BANK_BUCKET,
+        filename=f"{wikipedia.fetch_directory}/{settings_filename}",
+        local_filename=local_filename,
+    )
+    if not os.path.exists(local_filename):
+        return None
+
+    with open(local_filename, "r", encoding="utf-8") as f:
+        return json.load(f).get("hash")
+
+
+def get_previously_fetched_tables(page, columns):
+    """Get the tables from the last fetch for days whose last edit can no longer change.
+
+    The last edit of any day before yesterday is fixed, so the table from that revision is reused
+    rather than downloaded again. The previous fetch is ignored, and the full history downloaded,
+    if the page's parse settings have changed since then or if today is FULL_DOWNLOAD_WEEKDAY.
+
+    Returns a dict of {iso date: table}.
+    """
+    page_title = page.get("page_title")
+    if dates.get_date_today().weekday() == FULL_DOWNLOAD_WEEKDAY:
+        logger.info(f"Scheduled full download for {page_title}.")
+        return {}
+
+    if get_previous_parse_settings_hash(page) != get_parse_settings_hash(page):
+        logger.info(f"Parse settings changed for {page_title}; downloading full history.")
+        return {}
+
+    filename = wikipedia.get_fetch_filename(page.get("id_root"))
+    dff = data_utils.download_and_read(
+        filename=f"{wikipedia.fetch_directory}/{filename}",
+        local_filename=f"/tmp/previous_{filename}",
+        df_tmp=pd.DataFrame(),
+        dtype={},
+    )
+    if dff.empty or set(dff.columns) != set(columns + ["date"]):
+        return {}
+
+    value_col = page["fields"]["value"]
+    dff[value_col] = dff[value_col].astype(page["resolution_file_value_column_dtype"])
+    dff = dff.loc[dff["date"] < dates.get_date_yesterday().isoformat(), columns + ["date"]]
+    return {date: dfw for date, dfw in dff.groupby("date", sort=False)}
+
+
 def download_tables(page):
     """Download all historical changes for the tables on the page."""
     session = make_session()
@@ -135,8 +213,15 @@ def download_tables(page):
     value_col = page["fields"]["value"]
     value_col_dtype = page["resolution_file_value_column_dtype"]
 
+    previous_tables = get_previously_fetched_tables(page=page, columns=columns)
+
     df_list = []
     for edit_date, revid in tqdm(edit_history, f"Downloading edit histories for {page_title}"):
+        dfw = previous_tables.get(edit_date.date().isoformat())
+        if dfw is not None:
+            df_list.append(dfw)
+            continue
+
         try:
             dfw = download_wikipedia_table(
                 page_title=page_title,
@@ -179,6 +264,16 @@ def download_and_store_wikipedia_tables(page):
         destination_folder=wikipedia.fetch_directory,
     )
 
+    # Record the settings these tables were parsed with so the next fetch knows if it can reuse them
+    local_settings_filename = f"/tmp/{get_parse_settings_filename(page)}"
+    with open(local_settings_filename, "w", encoding="utf-8") as f:
+        json.dump({"hash": get_parse_settings_hash(page)}, f)
+    gcp.storage.upload(
+        bucket_name=env.QUESTION_BANK_BUCKET,
+        local_filename=local_settings_filename,
+        destination_folder=wikipedia.fetch_directory,
+    )
+
 
 @decorator.log_runtime
 def driver(_):
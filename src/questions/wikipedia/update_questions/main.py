@@ -100,8 +100,7 @@ def add_to_dfq(dfq, dfr, page, wid, id_field_value):
         combined_fill_values = {**default_values, **fill_values}
         return page[page_key][0].format(**combined_fill_values)
 
-    dfr = dfr.sort_values(by="date")
-    value = dfr.iloc[-1]["value"]
+    value = dfr.loc[dfr["date"].idxmax(), "value"]
 
     resolved = value is None
     if "is_resolved_func" in page.keys():
@@ -227,7 +226,7 @@ def driver(_):
 
     # Save
     with open(filenames["local_question"], "w", encoding="utf-8") as f:
-        for record in dfq.to_dict(orient="records"):
+        for record in data_utils.iter_records(dfq):
             jsonl_str = json.dumps(record, ensure_ascii=False)
             f.write(jsonl_str + "\n")
 
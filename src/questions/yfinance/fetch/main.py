@@ -160,7 +160,7 @@ def driver(_):
     # Save and upload
     with open(filenames["local_fetch"], "w", encoding="utf-8") as f:
         # can't use `dfq.to_json` because we don't want escape chars
-        for record in all_stock.to_dict("records"):
+        for record in data_utils.iter_records(all_stock):
             json_str = json.dumps(record, ensure_ascii=False)
             f.write(json_str + "\n")
 
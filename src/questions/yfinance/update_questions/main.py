@@ -194,6 +194,7 @@ def update_questions(dfq, dff):
     It also appends new community predictions to dfr for each question in all_questions_to_add.
     """
     dff_list = dff.to_dict("records")
+    questions = []
     day_diff = (dates.get_date_today() - constants.QUESTION_BANK_DATA_STORAGE_START_DATE).days
     period = select_time_range(day_diff)
 
@@ -203,19 +204,9 @@ def update_questions(dfq, dff):
         del question["fetch_datetime"]
         del question["probability"]
 
-        # Check if the question exists in dfq
-        if question["id"] in dfq["id"].values:
-            # Case 1: Update existing question
-            dfq_index = dfq.index[dfq["id"] == question["id"]].tolist()[0]
-            for key, value in question.items():
-                dfq.at[dfq_index, key] = value
-        else:
-            # Case 2: Append new question
-            new_q_row = pd.DataFrame([question])
-            new_q_row = new_q_row.astype(constants.QUESTION_FILE_COLUMN_DTYPE)
-            dfq = pd.concat([dfq, new_q_row], ignore_index=True)
-
-    return dfq
+        questions.append(question)
+
+    return data_utils.upsert_questions(dfq, questions, dtype=constants.QUESTION_FILE_COLUMN_DTYPE)
 
 
 @decorator.log_runtime
@@ -364,13 +364,16 @@ def print_question_set_breakdown(human_or_llm, forecast_due_date, df, df_orig_qu
     n_questions = n_single_questions + n_combo_questions
     logger.info(f"TOTAL questions: {n_questions:,}")
 
-    df_res_date = df[df["resolution_date"].isin(resolution_date)]
-    for _, row in df_orig_question_set.iterrows():
-        df_tmp = df_res_date[
-            (df_res_date["id"] == row["id"]) & (df_res_date["source"] == row["source"])
-        ]
-        if df_tmp.empty:
-            logger.warning(f" N/A resolution for {row['source']} {row['id']}")
+    df_res_date = df.loc[df["resolution_date"].isin(resolution_date), ["id", "source"]]
+    df_missing = pd.merge(
+        df_orig_question_set[["id", "source"]],
+        df_res_date.drop_duplicates(),
+        on=["id", "source"],
+        how="left",
+        indicator=True,
+    )
+    for _, row in df_missing[df_missing["_merge"] == "left_only"].iterrows():
+        logger.warning(f" N/A resolution for {row['source']} {row['id']}")
 
 
 def impute_missing_forecasts(
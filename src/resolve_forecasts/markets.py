@@ -30,7 +30,7 @@ def resolve(source, df, dfq, dfr):
     df_market, df = resolution.split_dataframe_on_source(df=df, source=source)
 
     # Check that we have market info for all markets in the dataset
-    unique_ids_for_resolved_markets = dfr["id"].unique()
+    unique_ids_for_resolved_markets = set(dfr["id"])
 
     def check_id(mid):
         if resolution.is_combo(mid):
@@ -92,45 +92,49 @@ def resolve(source, df, dfq, dfr):
     df_standard = df_standard.drop(columns=["date", "value", "forecast_due_date_minus_one"])
 
     # Overwrite resolved_to values with resolved_value if question has resolved
-    for mid in dfq.loc[dfq["resolved"], "id"]:
-        if (df_standard["id"] == mid).any():
-            resolved_value = dfr.loc[dfr["id"] == mid, "value"].iat[-1]
-            resolution_date = resolution.get_market_resolution_date(dfq[dfq["id"] == mid])
-            df_standard.loc[df_standard["id"] == mid, "resolved"] = True
-            df_standard.loc[df_standard["id"] == mid, "resolved_to"] = resolved_value
-            df_standard.loc[df_standard["id"] == mid, "resolution_date"] = resolution_date
-
-            if resolved_value != 0 and resolved_value != 1:
-                # Sometimes this happens, e.g.:
-                #   https://manifold.markets/bens/will-anyone-be-fired-or-resign-for
-                # Sometimes data was pulled incorrectly. Print a warning message to check data was
-                # pulled correctly.
-                #
-                # Set to np.nan for resolution purposes.
-                url = dfq[dfq["id"] == mid]["url"].iloc[0]
-                message = (
-                    f"`{source}` question {mid} resolved to {resolved_value} (not 0 or 1). "
-                    "Resolving to NaN for now. Check to ensure data pulled correctly.\n"
-                    f"{url}\n"
-                )
-                logger.warning(colored(message, "red"))
-                df_standard.loc[df_standard["id"] == mid, "resolved_to"] = np.nan
-                if not pd.isna(resolved_value):
-                    slack.send_message(message=message)
-
-            if resolution_date <= forecast_due_date.date():
-                # Discard all forecasts that resolved <= forecast_due_date
-                df_standard.loc[df_standard["id"] == mid, "resolved_to"] = np.nan
-                rd = resolution_date.strftime("%Y-%m-%d")
-                fd = forecast_due_date.strftime("%Y-%m-%d")
-                url = dfq[dfq["id"] == mid]["url"].iloc[0]
-                logger.warning(
-                    colored(
-                        f"`{source} question {mid}; was resolved on {rd} but the forecast date is "
-                        f"{fd}. Nullifying!\n     {url}",
-                        "red",
-                    )
+    # Look up the last market value by id instead of scanning dfr for every resolved question
+    last_market_values = dfr.drop_duplicates(subset="id", keep="last").set_index("id")["value"]
+    resolved_mask = dfq["resolved"] & dfq["id"].isin(df_standard["id"])
+    for mid in dfq.loc[resolved_mask, "id"]:
+        mid_mask = df_standard["id"] == mid
+        dfq_mid = dfq[dfq["id"] == mid]
+        resolved_value = last_market_values[mid]
+        resolution_date = resolution.get_market_resolution_date(dfq_mid)
+        df_standard.loc[mid_mask, "resolved"] = True
+        df_standard.loc[mid_mask, "resolved_to"] = resolved_value
+        df_standard.loc[mid_mask, "resolution_date"] = resolution_date
+
+        if resolved_value != 0 and resolved_value != 1:
+            # Sometimes this happens, e.g.:
+            #   https://manifold.markets/bens/will-anyone-be-fired-or-resign-for
+            # Sometimes data was pulled incorrectly. Print a warning message to check data was
+            # pulled correctly.
+            #
+            # Set to np.nan for resolution purposes.
+            url = dfq_mid["url"].iloc[0]
+            message = (
+                f"`{source}` question {mid} resolved to {resolved_value} (not 0 or 1). "
+                "Resolving to NaN for now. Check to ensure data pulled correctly.\n"
+                f"{url}\n"
+            )
+            logger.warning(colored(message, "red"))
+            df_standard.loc[mid_mask, "resolved_to"] = np.nan
+            if not pd.isna(resolved_value):
+                slack.send_message(message=message)
+
+        if resolution_date <= forecast_due_date.date():
+            # Discard all forecasts that resolved <= forecast_due_date
+            df_standard.loc[mid_mask, "resolved_to"] = np.nan
+            rd = resolution_date.strftime("%Y-%m-%d")
+            fd = forecast_due_date.strftime("%Y-%m-%d")
+            url = dfq_mid["url"].iloc[0]
+            logger.warning(
+                colored(
+                    f"`{source} question {mid}; was resolved on {rd} but the forecast date is "
+                    f"{fd}. Nullifying!\n     {url}",
+                    "red",
                 )
+            )
 
     df_standard["resolution_date"] = pd.to_datetime(df_standard["resolution_date"], errors="coerce")
     df_standard.sort_values(by=["id", "resolution_date"], inplace=True, ignore_index=True)